@@ -3,60 +3,68 @@ import json
 import random
 import re
 import asyncio
-import uuid
 import string
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
-from openai import OpenAI
+import time
+from bisect import bisect
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import accumulate, count as _count
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Set, Union
+from openai import AsyncOpenAI
+try:
+    import orjson  # Необязательная зависимость: ускоряет сохранение JSON
+except ImportError:
+    orjson = None
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+# Собственный генератор случайных чисел модуля (можно зафиксировать через _RNG.seed)
+_RNG = random.Random()
+
 # Кэш для хранения серийных номеров по моделям
 model_serial_cache = {}
 
 def generate_serial_number(length: int) -> str:
     """Генерация случайного серийного номера заданной длины"""
     chars = string.ascii_uppercase + string.digits
-    return ''.join(random.choices(chars, k=length))
+    return ''.join(_RNG.choices(chars, k=length))
+
+# Строка вида KEY=value (комментарии после # отбрасываются)
+_ENV_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^\n#]+)', re.MULTILINE)
+
+def parse_env(env_content: str) -> Dict[str, str]:
+    """Разбор содержимого файла .env в словарь за один проход"""
+    env: Dict[str, str] = {}
+    for match in _ENV_RE.finditer(env_content):
+        # Удаляем кавычки, если они есть; при повторе ключа остается первое значение
+        env.setdefault(match.group(1), match.group(2).strip().strip('\'"').strip())
+    return env
 
 def get_env_value(key: str, env_content: str) -> Optional[str]:
     """Получение значения переменной из файла .env"""
-    try:
-        # Ищем строку, начинающуюся с ключа
-        pattern = fr'^{key}\s*=\s*([^\n#]+)'
-        match = re.search(pattern, env_content, re.MULTILINE)
-        if not match:
-            return None
-        
-        value = match.group(1).strip()
-        # Удаляем кавычки, если они есть
-        value = value.strip('\'"')
-        return value.strip()
-    except Exception as e:
-        print(f"Ошибка при получении значения {key}: {e}")
-        return None
+    return parse_env(env_content).get(key)
 
 def init_openai_client() -> None:
-    """Инициализация клиента OpenAI"""
+    """Инициализация клиента OpenAI (повторные вызовы используют уже созданный клиент и его пул соединений)"""
     global client
+    if client is not None:
+        return
     try:
         # Чтение файла .venv
         venv_path = Path('venv/.venv')
         if not venv_path.exists():
             raise FileNotFoundError(f"Файл {venv_path} не найден")
             
-        with open(venv_path, 'r', encoding='utf-8') as f:
-            venv_content = f.read()
-        
         # Получаем AI_TUNNEL_KEY
-        ai_tunnel_key = get_env_value('AI_TUNNEL_KEY', venv_content)
+        ai_tunnel_key = parse_env(venv_path.read_text(encoding='utf-8')).get('AI_TUNNEL_KEY')
         if not ai_tunnel_key:
             raise ValueError("Не найден AI_TUNNEL_KEY в файле venv/.venv")
         
-        # Инициализация клиента OpenAI
-        client = OpenAI(
+        # Инициализация асинхронного клиента OpenAI
+        client = AsyncOpenAI(
             api_key=ai_tunnel_key,
             base_url="https://api.aitunnel.ru/v1"
         )
@@ -70,8 +78,11 @@ def init_openai_client() -> None:
 NUM_EMPLOYEES = 1000
 NUM_DEVICES = 7000
 
+# Заранее сформированные идентификаторы сотрудников (emp_0001...)
+_EMP_IDS = tuple(f"emp_{i:04d}" for i in range(1, NUM_EMPLOYEES + 1))
+
 # Глобальные переменные
-client: Optional[OpenAI] = None
+client: Optional[AsyncOpenAI] = None
 
 # Статусы устройств
 class DeviceStatus(Enum):
@@ -107,78 +118,49 @@ assigned_employees: Set[str] = set()  # Для отслеживания назн
 
 # Модели устройств
 DEVICE_MODELS = {
+    DeviceType.MONITOR: [
+        'Dell U2419H', 'LG 24MK400H-B', 'Samsung S24R350', 'Acer R240Y', 'HP 24mh'
+    ],
     DeviceType.DESKTOP: [
-        "Dell OptiPlex 3080", "HP ProDesk 400 G7", "Lenovo ThinkCentre M75q", 
-        "Acer Veriton X2660G", "HP EliteDesk 800 G6"
+        'Dell OptiPlex 3080', 'HP ProDesk 400 G7', 'Lenovo ThinkCentre M75q', 'Acer Veriton X2660G'
     ],
     DeviceType.LAPTOP: [
-        "Dell Latitude 5420", "HP EliteBook 840 G8", "Lenovo ThinkPad T14", 
-        "Apple MacBook Pro 16"
+        'Dell Latitude 5420', 'HP EliteBook 840 G8', 'Lenovo ThinkPad T14', 'Apple MacBook Pro 16" M1'
     ],
-    DeviceType.MONITOR: [
-        "Dell U2419H", "LG 24MK400H-B", "Samsung S24R350", 
-        "Acer R240Y", "HP 24mh"
+    DeviceType.TABLET: [
+        'Apple iPad Pro 12.9"', 'Samsung Galaxy Tab S7', 'Huawei MatePad Pro', 'Lenovo Tab P12 Pro'
+    ],
+    DeviceType.PHONE: [
+        'iPhone 13', 'Samsung Galaxy S21', 'Xiaomi Redmi Note 11', 'Huawei P50'
     ],
     DeviceType.KEYBOARD: [
-        "Logitech K120", "Dell KB216", "HP K1500", "A4Tech KR-85"
+        'Logitech K120', 'Dell KB216', 'HP K1500', 'A4Tech KR-85'
     ],
     DeviceType.MOUSE: [
-        "Logitech M90", "Dell MS116", "HP X500", "A4Tech OP-620D"
-    ],
-    DeviceType.PHONE: [
-        "Cisco 8845", "Yealink T54W", "Grandstream GXP2170", "Panasonic KX-UT113"
-    ],
-    DeviceType.TABLET: [
-        "Apple iPad Pro 12.9", "Samsung Galaxy Tab S7", "Huawei MatePad Pro"
+        'Logitech M90', 'Dell MS116', 'HP X500', 'A4Tech OP-620D'
     ]
 }
 
 # Настройки по умолчанию для типов устройств
 DEVICE_DEFAULTS = {
-    DeviceType.DESKTOP: {
-        'min': 1,  # Минимальное количество на сотрудника
-        'max': 1,  # Максимальное количество на сотрудника
-        'useful_life': 5,  # Срок полезного использования в годах
-        'manager_only': False
-    },
-    DeviceType.LAPTOP: {
-        'min': 0,
-        'max': 1,
-        'useful_life': 4,
-        'manager_only': True
-    },
-    DeviceType.MONITOR: {
-        'min': 1,
-        'max': 2,
-        'useful_life': 7,
-        'manager_only': False
-    },
-    DeviceType.KEYBOARD: {
-        'min': 1,
-        'max': 1,
-        'useful_life': 4,
-        'manager_only': False
-    },
-    DeviceType.MOUSE: {
-        'min': 1,
-        'max': 1,
-        'useful_life': 3,
-        'manager_only': False
-    },
-    DeviceType.PHONE: {
-        'min': 1,
-        'max': 1,
-        'useful_life': 4,
-        'manager_only': False
-    },
-    DeviceType.TABLET: {
-        'min': 0,
-        'max': 1,
-        'useful_life': 3,
-        'manager_only': True
-    }
+    DeviceType.MONITOR: {'min': 1, 'max': 2, 'useful_life': 5},
+    DeviceType.DESKTOP: {'min': 1, 'max': 1, 'useful_life': 5},
+    DeviceType.LAPTOP: {'min': 0, 'max': 1, 'useful_life': 3, 'manager_only': True},
+    DeviceType.TABLET: {'min': 0, 'max': 1, 'useful_life': 3, 'manager_only': True},
+    DeviceType.PHONE: {'min': 1, 'max': 1, 'useful_life': 3},
+    DeviceType.KEYBOARD: {'min': 1, 'max': 1, 'useful_life': 5},
+    DeviceType.MOUSE: {'min': 1, 'max': 1, 'useful_life': 5}
 }
 
+# Типы устройств (тип, мин., макс. количество), доступные руководителям и остальным сотрудникам
+_DEVICE_TYPES_MANAGER = tuple(
+    (dev_type, settings['min'], settings['max']) for dev_type, settings in DEVICE_DEFAULTS.items()
+)
+_DEVICE_TYPES_REGULAR = tuple(
+    entry for entry in _DEVICE_TYPES_MANAGER
+    if not DEVICE_DEFAULTS[entry[0]].get('manager_only', False)
+)
+
 # Статусы устройств с весами
 DEVICE_STATUS_WEIGHTS = [
     (DeviceStatus.WORKING.value, 85),
@@ -187,6 +169,49 @@ DEVICE_STATUS_WEIGHTS = [
     (DeviceStatus.LOST.value, 2)
 ]
 
+# Дополнительные устройства для руководителей и вероятность их выдачи
+MANAGER_EXTRA_DEVICES = (
+    (DeviceType.LAPTOP, 0.7),  # 70% шанс на ноутбук
+    (DeviceType.TABLET, 0.4),   # 40% шанс на планшет
+    (DeviceType.MONITOR, 0.3)   # 30% шанс на дополнительный монитор
+)
+
+# Веса типов устройств при распределении оставшихся устройств
+DEVICE_TYPE_WEIGHTS = (
+    (DeviceType.DESKTOP, 20),
+    (DeviceType.LAPTOP, 15),
+    (DeviceType.MONITOR, 25),
+    (DeviceType.PHONE, 15),
+    (DeviceType.TABLET, 10),
+    (DeviceType.KEYBOARD, 10),
+    (DeviceType.MOUSE, 5)
+)
+_DEVICE_TYPE_VALUES = tuple(dev_type for dev_type, _ in DEVICE_TYPE_WEIGHTS)
+_DEVICE_TYPE_CUM = tuple(accumulate(weight for _, weight in DEVICE_TYPE_WEIGHTS))
+
+# Значения статусов и накопленные веса (считаются один раз при импорте)
+_STATUS_VALUES = tuple(status for status, _ in DEVICE_STATUS_WEIGHTS)
+_STATUS_CUM = tuple(accumulate(weight for _, weight in DEVICE_STATUS_WEIGHTS))
+_STATUS_TOTAL = _STATUS_CUM[-1]
+
+def _pick_status() -> str:
+    """Выбор статуса устройства с учетом весов"""
+    return _STATUS_VALUES[bisect(_STATUS_CUM, _RNG.random() * _STATUS_TOTAL)]
+
+# Чем новее устройство, тем выше начальный КТС. Границы возраста в днях:
+# меньше 6 месяцев, от 6 месяцев до года, 1-2 года, 2-4 года, более 4 лет
+_CTC_AGE_LIMITS = (180, 365, 730, 1460)
+_CTC_BASE_RANGES = ((80, 100), (70, 95), (60, 85), (40, 70), (20, 50))
+
+# Все равновероятные значения КТС для каждого возрастного интервала: базовое значение
+# плюс отклонение +/- 5, ограниченное диапазоном от 1 до 100. Один выбор из таблицы
+# дает то же распределение, что и два независимых randint.
+_CTC_TABLES = tuple(
+    tuple(max(1, min(100, base + deviation))
+          for base in range(low, high + 1) for deviation in range(-5, 6))
+    for low, high in _CTC_BASE_RANGES
+)
+
 @dataclass
 class Employee:
     empID: str
@@ -299,6 +324,36 @@ async def generate_positions() -> List[Dict]:
     ]
     return positions
 
+# Производители, распознаваемые по названию модели
+MANUFACTURERS = (
+    'Dell', 'HP', 'Lenovo', 'Acer', 'LG', 'Samsung', 'Apple',
+    'Logitech', 'Huawei', 'Xiaomi', 'A4Tech'
+)
+
+@lru_cache(maxsize=None)
+def _manufacturer(model: str) -> str:
+    """Определение производителя по названию модели"""
+    model_lower = model.lower()
+    for name in MANUFACTURERS:
+        if name.lower() in model_lower:
+            return name
+    return 'Неизвестный производитель'
+
+# Префиксы серийных номеров по производителям
+SERIAL_PREFIXES = {
+    'Dell': 'DL',
+    'HP': 'HP',
+    'Lenovo': 'LN',
+    'Acer': 'AC',
+    'LG': 'LG',
+    'Samsung': 'SM',
+    'Apple': 'AP',
+    'Logitech': 'LG',
+    'Huawei': 'HW',
+    'Xiaomi': 'XM',
+    'A4Tech': 'AT'
+}
+
 class DataGenerator:
     def __init__(self):
         self.employees: List[Employee] = []
@@ -316,7 +371,7 @@ class DataGenerator:
             
             # Генерация уникального табельного номера
             while True:
-                tn = f"{random.randint(1, 99999999):08d}"
+                tn = f"{_RNG.randint(1, 99999999):08d}"
                 if tn not in self.used_tns:
                     self.used_tns.add(tn)
                     break
@@ -328,7 +383,7 @@ class DataGenerator:
             city = self._select_city()
             
             # Выбор должности
-            position = random.choice(positions)
+            position = _RNG.choice(positions)
             is_manager = position.get('is_manager', False)
             
             # Создание сотрудника
@@ -352,7 +407,7 @@ class DataGenerator:
                 empID=str(emp_id),
                 fio=f"Сотрудник {emp_id}",
                 tn="",
-                position=random.choice(positions)['name'],
+                position=_RNG.choice(positions)['name'],
                 division="",
                 location="",
                 is_manager=False
@@ -378,62 +433,40 @@ class DataGenerator:
             
             # Если тип устройства не указан, выбираем случайный
             if device_type is None:
-                available_types = []
-                for dev_type, settings in DEVICE_DEFAULTS.items():
-                    # Пропускаем устройства только для руководителей, если сотрудник не руководитель
-                    if settings.get('manager_only', False) and not is_manager:
-                        continue
-                    # Проверяем минимальное и максимальное количество устройств этого типа
-                    if settings['min'] > 0 or random.random() < 0.5:  # 50% шанс добавить опциональное устройство
-                        available_types.append(dev_type)
+                # Устройства только для руководителей уже исключены из пула обычных сотрудников
+                pool = _DEVICE_TYPES_MANAGER if is_manager else _DEVICE_TYPES_REGULAR
+                available_types = [
+                    dev_type for dev_type, min_count, _ in pool
+                    if min_count > 0 or _RNG.random() < 0.5  # 50% шанс добавить опциональное устройство
+                ]
                 
                 if not available_types:
                     available_types = [DeviceType.PHONE]  # Хотя бы телефон у всех
                 
-                device_type = random.choice(available_types)
+                device_type = _RNG.choice(available_types)
             
             # Если модель не указана, выбираем случайную из доступных для данного типа
             if model is None:
-                model = random.choice(DEVICE_MODELS[device_type])
+                model = _RNG.choice(DEVICE_MODELS[device_type])
             
-            # Генерация даты поступления (последние 10 лет)
-            date_receipt = (datetime.now() - timedelta(days=random.randint(1, 3650))).strftime('%Y-%m-%d')
+            # Генерация даты поступления (последние 10 лет); возраст в днях сохраняем для расчета КТС
+            age_days = _RNG.randint(1, 3650)
+            date_receipt = date.fromordinal(date.today().toordinal() - age_days).isoformat()
             
             # Получаем настройки для типа устройства
             settings = DEVICE_DEFAULTS[device_type]
             
             # Генерация статуса с учетом весов
-            status = random.choices(
-                [s for s, _ in DEVICE_STATUS_WEIGHTS],
-                weights=[w for _, w in DEVICE_STATUS_WEIGHTS]
-            )[0]
+            status = _pick_status()
             
             # Генерация серийного номера
             serial_number = self._generate_serial_number(model)
             
-            # Расчет КТС с учетом возраста устройства
-            ctc = self._calculate_ctc(date_receipt)
+            # Расчет КТС с учетом возраста устройства (без повторного разбора даты)
+            ctc = self._ctc_for_age(age_days)
             
             # Определяем производителя для номенклатуры
-            manufacturer_map = {
-                'Dell': 'Dell',
-                'HP': 'HP',
-                'Lenovo': 'Lenovo',
-                'Acer': 'Acer',
-                'LG': 'LG',
-                'Samsung': 'Samsung',
-                'Apple': 'Apple',
-                'Logitech': 'Logitech',
-                'Huawei': 'Huawei',
-                'Xiaomi': 'Xiaomi',
-                'A4Tech': 'A4Tech'
-            }
-            
-            manufacturer = 'Неизвестный производитель'
-            for name, mf in manufacturer_map.items():
-                if name.lower() in model.lower():
-                    manufacturer = mf
-                    break
+            manufacturer = _manufacturer(model)
             
             # Формируем номенклатуру: [Тип] [Производитель] [Модель] [Серийный номер]
             nomenclature = f"{device_type.value} {manufacturer} {model} (SN: {serial_number})"
@@ -460,6 +493,44 @@ class DataGenerator:
             traceback.print_exc()
             return None
     
+    def generate_devices_bulk(self, specs: List[Tuple[str, DeviceType, str]], start_id: int = 1) -> List[Device]:
+        """
+        Пакетная генерация устройств
+        
+        Даты поступления и статусы разыгрываются сразу для всего пакета, а КТС
+        выбирается из таблицы для возрастного интервала без разбора строки даты.
+        
+        Args:
+            specs: Список кортежей (ID сотрудника, тип устройства, модель)
+            start_id: ID первого устройства в пакете
+            
+        Returns:
+            Список сгенерированных устройств в порядке specs
+        """
+        size = len(specs)
+        today = date.today().toordinal()
+        ages = _RNG.choices(range(1, 3651), k=size)  # последние 10 лет
+        statuses = _RNG.choices(_STATUS_VALUES, cum_weights=_STATUS_CUM, k=size)
+        
+        devices = []
+        for device_id, (emp_id, device_type, model), age, status in zip(
+                _count(start_id), specs, ages, statuses):
+            serial_number = self._generate_serial_number(model)
+            devices.append(Device(
+                device_id=str(device_id),
+                emp_id=emp_id,
+                nomenclature=f"{device_type.value} {_manufacturer(model)} {model} (SN: {serial_number})",
+                model=model,
+                date_receipt=date.fromordinal(today - age).isoformat(),
+                useful_life=DEVICE_DEFAULTS[device_type]['useful_life'],
+                status=status,
+                ctc=_RNG.choice(_CTC_TABLES[bisect(_CTC_AGE_LIMITS, age)]),
+                serial_number=serial_number
+            ))
+        
+        self.devices.extend(devices)
+        return devices
+    
     def _generate_fio(self) -> str:
         """
         Генерация ФИО
@@ -481,64 +552,48 @@ class DataGenerator:
                         "Александровна", "Дмитриевна", "Сергеевна", "Андреевна",
                         "Алексеевна", "Максимовна", "Ильинична", "Кирилловна"]
         
-        return f"{random.choice(last_names)} {random.choice(first_names)} {random.choice(middle_names)}"
+        return f"{_RNG.choice(last_names)} {_RNG.choice(first_names)} {_RNG.choice(middle_names)}"
     
     def _generate_fallback_fio(self) -> str:
         """Запасной генератор ФИО (теперь не используется, оставлен для совместимости)"""
         return self._generate_fio()
     
+    def _serial_cache(self, model: str) -> Dict[str, Any]:
+        """Данные для генерации серийных номеров модели (префикс, счетчик, использованные номера)"""
+        if model in self._model_serial_cache:
+            return self._model_serial_cache[model]
+        
+        # Префикс определяем по производителю (результат _manufacturer уже закэширован)
+        prefix = SERIAL_PREFIXES.get(_manufacturer(model), 'SN')
+        
+        # Инициализируем кэш для модели
+        # Год и месяц выпуска (последние 2 цифры года и месяц с ведущим нулём) определяем один раз
+        now = datetime.now()
+        self._model_serial_cache[model] = {
+            'prefix': prefix,
+            'period': f"{str(now.year)[-2:]}{now.month:02d}",
+            'counter': 0,
+            'used': set()
+        }
+        return self._model_serial_cache[model]
+    
     def _generate_serial_number(self, model: str) -> str:
         """
         Генерация уникального серийного номера для модели.
         Формат: [Префикс производителя][Год][Месяц][Последовательный номер][Контрольная сумма]
         Длина фиксирована для каждой модели.
         """
-        if model not in self._model_serial_cache:
-            # Определяем префикс по производителю
-            prefix_map = {
-                'Dell': 'DL',
-                'HP': 'HP',
-                'Lenovo': 'LN',
-                'Acer': 'AC',
-                'LG': 'LG',
-                'Samsung': 'SM',
-                'Apple': 'AP',
-                'Logitech': 'LG',
-                'Huawei': 'HW',
-                'Xiaomi': 'XM',
-                'A4Tech': 'AT'
-            }
-            
-            # Находим префикс по названию модели
-            prefix = 'SN'
-            for name, code in prefix_map.items():
-                if name.lower() in model.lower():
-                    prefix = code
-                    break
-            
-            # Инициализируем кэш для модели
-            self._model_serial_cache[model] = {
-                'prefix': prefix,
-                'counter': 0,
-                'used': set()
-            }
-        
         # Получаем данные модели
-        cache = self._model_serial_cache[model]
+        cache = self._serial_cache(model)
         
         # Генерируем уникальный серийный номер
         while True:
-            # Текущая дата
-            now = datetime.now()
-            year = str(now.year)[-2:]  # Последние 2 цифры года
-            month = f"{now.month:02d}"  # Месяц с ведущим нулём
-            
             # Увеличиваем счётчик и форматируем с ведущими нулями
             cache['counter'] += 1
             counter_str = f"{cache['counter']:06d}"  # 6 цифр с ведущими нулями
             
             # Собираем базовый номер
-            base = f"{cache['prefix']}{year}{month}{counter_str}"
+            base = f"{cache['prefix']}{cache['period']}{counter_str}"
             
             # Добавляем контрольную сумму (сумма кодов символов по модулю 10)
             checksum = str(sum(ord(c) for c in base) % 10)
@@ -560,32 +615,19 @@ class DataGenerator:
             int: Значение КТС от 1 до 100
         """
         try:
-            receipt_date = datetime.strptime(date_receipt, '%Y-%m-%d')
-            age_days = (datetime.now() - receipt_date).days
-            
-            # Чем новее устройство, тем выше начальный КТС
-            if age_days < 180:  # Меньше 6 месяцев
-                base_ctc = random.randint(80, 100)
-            elif age_days < 365:  # От 6 месяцев до года
-                base_ctc = random.randint(70, 95)
-            elif age_days < 730:  # 1-2 года
-                base_ctc = random.randint(60, 85)
-            elif age_days < 1460:  # 2-4 года
-                base_ctc = random.randint(40, 70)
-            else:  # Более 4 лет
-                base_ctc = random.randint(20, 50)
-            
-            # Добавляем случайное отклонение +/- 5%
-            ctc = base_ctc + random.randint(-5, 5)
-            
-            # Ограничиваем значения от 1 до 100
-            return max(1, min(100, ctc))
+            age_days = date.today().toordinal() - date.fromisoformat(date_receipt).toordinal()
+            return self._ctc_for_age(age_days)
             
         except Exception as e:
             print(f"Ошибка при расчете КТС: {e}")
             # Возвращаем среднее значение в случае ошибки
-            return random.randint(40, 80)
+            return _RNG.randint(40, 80)
             
+    @staticmethod
+    def _ctc_for_age(age_days: int) -> int:
+        """КТС по возрасту устройства в днях со случайным отклонением"""
+        return _RNG.choice(_CTC_TABLES[bisect(_CTC_AGE_LIMITS, age_days)])
+    
     def _select_city(self) -> str:
         """Выбор города с учетом распределения по городам"""
         # Выбираем город с учетом весов (чем больше город, тем больше вероятность выбора)
@@ -599,7 +641,7 @@ class DataGenerator:
         normalized_weights = [weight / total_weight for city, weight in city_weights]
         
         # Выбираем город с учетом весов
-        selected_city = random.choices(
+        selected_city = _RNG.choices(
             [city for city, weight in city_weights],
             weights=normalized_weights,
             k=1
@@ -618,7 +660,7 @@ class DataGenerator:
 Петрова Мария Сергеевна
 Сидоров Алексей Петрович"""
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="deepseek-chat",
                 messages=[
                     {"role": "system", "content": "Ты помощник, который генерирует списки русских ФИО. Важно: только ФИО, по одному на строку."},
@@ -648,36 +690,11 @@ class DataGenerator:
     
     def _generate_date_receipt(self) -> str:
         """Генерация даты поступления"""
-        start_date = datetime(2015, 1, 1)
-        end_date = datetime(2025, 6, 1)
-        delta = end_date - start_date
-        random_days = random.randint(0, delta.days)
-        return (start_date + timedelta(days=random_days)).strftime('%Y-%m-%d')
+        return random_date()
     
     def _generate_status(self) -> str:
         """Генерация статуса с учетом весов"""
-        total = sum(weight for status, weight in DEVICE_STATUS_WEIGHTS)
-        r = random.uniform(0, total)
-        upto = 0
-        for status, weight in DEVICE_STATUS_WEIGHTS:
-            if upto + weight >= r:
-                return status
-            upto += weight
-        return DEVICE_STATUS_WEIGHTS[0][0]
-    
-    def _generate_ctc(self, date_receipt: str) -> int:
-        """Генерация КТС с учетом даты поступления"""
-        receipt_date = datetime.strptime(date_receipt, '%Y-%m-%d')
-        now = datetime.now()
-        months_since_receipt = (now.year - receipt_date.year) * 12 + (now.month - receipt_date.month)
-        
-        # Чем новее устройство, тем выше КТС
-        if months_since_receipt <= 12:  # Менее года
-            return random.randint(80, 100)
-        elif months_since_receipt <= 36:  # 1-3 года
-            return random.randint(50, 90)
-        else:  # Более 3 лет
-            return random.randint(10, 60)
+        return _pick_status()
     
     async def assign_divisions(self, divisions: List[Dict]) -> None:
         """Назначение сотрудников по подразделениям"""
@@ -692,13 +709,13 @@ class DataGenerator:
         # Распределяем сотрудников по подразделениям
         for emp in self.employees:
             # Выбираем случайный уровень (0-3)
-            level = random.choices(
+            level = _RNG.choices(
                 [0, 1, 2, 3],
                 weights=[0.02, 0.08, 0.3, 0.6]  # Больше всего сотрудников в секторах
             )[0]
             
             # Выбираем случайное подразделение нужного уровня
-            division = random.choice(level_groups[level])
+            division = _RNG.choice(level_groups[level])
             emp.division = division['name']
     
     async def generate_all_data(self) -> Dict[str, List[Dict]]:
@@ -747,10 +764,10 @@ class DataGenerator:
                     break
                     
                 # Выбираем модель для данного типа устройства
-                model = random.choice(DEVICE_MODELS[device_type])
+                model = _RNG.choice(DEVICE_MODELS[device_type])
                 
                 # Генерируем указанное количество устройств
-                count = random.randint(min_count, max_count)
+                count = _RNG.randint(min_count, max_count)
                 for _ in range(count):
                     if device_count >= NUM_DEVICES:
                         break
@@ -768,21 +785,14 @@ class DataGenerator:
         # Затем генерируем дополнительные устройства для руководителей
         manager_employees = [emp for emp in self.employees if emp.is_manager]
         if manager_employees and device_count < NUM_DEVICES:
-            # Дополнительные устройства для руководителей
-            extra_devices = [
-                (DeviceType.LAPTOP, 0.7),  # 70% шанс на ноутбук
-                (DeviceType.TABLET, 0.4),   # 40% шанс на планшет
-                (DeviceType.MONITOR, 0.3)   # 30% шанс на дополнительный монитор
-            ]
-            
             for emp in manager_employees:
                 if device_count >= NUM_DEVICES:
                     break
                     
-                for device_type, probability in extra_devices:
-                    if random.random() < probability:
+                for device_type, probability in MANAGER_EXTRA_DEVICES:
+                    if _RNG.random() < probability:
                         # Выбираем модель для данного типа устройства
-                        model = random.choice(DEVICE_MODELS[device_type])
+                        model = _RNG.choice(DEVICE_MODELS[device_type])
                         
                         # Создаем устройство с указанным типом и моделью
                         await self.generate_device(
@@ -802,35 +812,18 @@ class DataGenerator:
         if remaining_devices > 0:
             print(f"Распределение оставшихся {remaining_devices} устройств...")
             
-            # Создаем список всех возможных типов устройств с их весами
-            device_weights = [
-                (DeviceType.DESKTOP, 20),
-                (DeviceType.LAPTOP, 15),
-                (DeviceType.MONITOR, 25),
-                (DeviceType.PHONE, 15),
-                (DeviceType.TABLET, 10),
-                (DeviceType.KEYBOARD, 10),
-                (DeviceType.MOUSE, 5)
-            ]
-            
             for _ in range(remaining_devices):
                 if device_count >= NUM_DEVICES:
                     break
                     
                 # Выбираем случайный тип устройства с учетом весов
-                total_weight = sum(weight for _, weight in device_weights)
-                r = random.uniform(0, total_weight)
-                upto = 0
-                for device_type, weight in device_weights:
-                    if upto + weight >= r:
-                        break
-                    upto += weight
+                device_type = weighted_choice(_DEVICE_TYPE_VALUES, _DEVICE_TYPE_CUM)
                 
                 # Выбираем случайного сотрудника
-                emp = random.choice(self.employees)
+                emp = _RNG.choice(self.employees)
                 
                 # Выбираем модель для данного типа устройства
-                model = random.choice(DEVICE_MODELS[device_type])
+                model = _RNG.choice(DEVICE_MODELS[device_type])
                 
                 # Создаем устройство
                 await self.generate_device(
@@ -871,164 +864,102 @@ class DataGenerator:
             'devices': devices_data
         }
 
-async def save_to_json(data: Dict, filename: str) -> None:
-    """Сохранение данных в JSON файл"""
-    filepath = Path('data') / filename
-    filepath.parent.mkdir(exist_ok=True)
+# Количество процессов для генерации устройств. Пакетная генерация NUM_DEVICES
+# устройств занимает доли секунды, поэтому по умолчанию пул процессов не используется
+DEVICE_WORKERS = 1
+
+def _generate_device_chunk(specs: List[Tuple[str, DeviceType, str]], start_id: int,
+                           serial_counters: Dict[str, int], seed: int) -> List[Device]:
+    """Генерация части устройств в процессе пула"""
+    _RNG.seed(seed)
+    generator = DataGenerator()
+    # Продолжаем нумерацию серийных номеров с того места, где остановились предыдущие части
+    for model, counter in serial_counters.items():
+        generator._serial_cache(model)['counter'] = counter
+    return generator.generate_devices_bulk(specs, start_id)
+
+def generate_devices(specs: List[Tuple[str, DeviceType, str]], workers: int = DEVICE_WORKERS) -> List[Device]:
+    """
+    Генерация устройств по списку (ID сотрудника, тип устройства, модель)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    При workers > 1 список делится на части, которые генерируются в пуле процессов.
+    Каждая часть получает свой seed и начальные счетчики серийных номеров,
+    поэтому ID и серийные номера совпадают с последовательной генерацией.
     
-    print(f"Данные сохранены в {filepath}")
-
-async def main():
-    """Основная функция"""
-    try:
-        # Инициализация клиента OpenAI
-        init_openai_client()
-        
-        # Создание генератора данных
-        generator = DataGenerator()
-        
-        # Генерация всех данных
-        data = await generator.generate_all_data()
-        
-        # Сохранение данных
-        await save_to_json(data, 'generated_data.json')
-        
-        print("Генерация данных успешно завершена!")
+    Args:
+        specs: Список кортежей (ID сотрудника, тип устройства, модель)
+        workers: Количество процессов
         
-    except Exception as e:
-        print(f"Произошла ошибка: {e}")
-        raise
-
-if __name__ == "__main__":
-    asyncio.run(main())
-
-# Конфигурация моделей устройств
-DEVICE_MODELS = {
-    DeviceType.MONITOR: [
-        'Dell U2419H', 'LG 24MK400H-B', 'Samsung S24R350', 'Acer R240Y', 'HP 24mh'
-    ],
-    DeviceType.DESKTOP: [
-        'Dell OptiPlex 3080', 'HP ProDesk 400 G7', 'Lenovo ThinkCentre M75q', 'Acer Veriton X2660G'
-    ],
-    DeviceType.LAPTOP: [
-        'Dell Latitude 5420', 'HP EliteBook 840 G8', 'Lenovo ThinkPad T14', 'Apple MacBook Pro 16" M1'
-    ],
-    DeviceType.TABLET: [
-        'Apple iPad Pro 12.9"', 'Samsung Galaxy Tab S7', 'Huawei MatePad Pro', 'Lenovo Tab P12 Pro'
-    ],
-    DeviceType.PHONE: [
-        'iPhone 13', 'Samsung Galaxy S21', 'Xiaomi Redmi Note 11', 'Huawei P50'
-    ],
-    DeviceType.KEYBOARD: [
-        'Logitech K120', 'Dell KB216', 'HP K1500', 'A4Tech KR-85'
-    ],
-    DeviceType.MOUSE: [
-        'Logitech M90', 'Dell MS116', 'HP X500', 'A4Tech OP-620D'
-    ]
-}
-
-# Настройки по умолчанию для типов устройств
-DEVICE_DEFAULTS = {
-    DeviceType.MONITOR: {'min': 1, 'max': 2, 'useful_life': 5},
-    DeviceType.DESKTOP: {'min': 1, 'max': 1, 'useful_life': 5},
-    DeviceType.LAPTOP: {'min': 0, 'max': 1, 'useful_life': 3, 'manager_only': True},
-    DeviceType.TABLET: {'min': 0, 'max': 1, 'useful_life': 3, 'manager_only': True},
-    DeviceType.PHONE: {'min': 1, 'max': 1, 'useful_life': 3},
-    DeviceType.KEYBOARD: {'min': 1, 'max': 1, 'useful_life': 5},
-    DeviceType.MOUSE: {'min': 1, 'max': 1, 'useful_life': 5}
-}
-
-# Статусы устройств
-DEVICE_STATUSES = [
-    {'status': 'исправен', 'weight': 85},
-    {'status': 'неисправен', 'weight': 10},
-    {'status': 'поиск', 'weight': 3},
-    {'status': 'утерян', 'weight': 2}
-]
+    Returns:
+        Список устройств в порядке specs с ID от 1
+    """
+    if workers <= 1 or len(specs) < 2:
+        return DataGenerator().generate_devices_bulk(specs)
+    
+    chunk_size = -(-len(specs) // workers)
+    chunks, start_ids, counters = [], [], []
+    models_seen: Dict[str, int] = defaultdict(int)
+    for start in range(0, len(specs), chunk_size):
+        chunk = specs[start:start + chunk_size]
+        chunks.append(chunk)
+        start_ids.append(start + 1)
+        counters.append(dict(models_seen))
+        for _, _, model in chunk:
+            models_seen[model] += 1
+    seeds = [_RNG.getrandbits(64) for _ in chunks]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(_generate_device_chunk, chunks, start_ids, counters, seeds)
+        return [device for part in parts for device in part]
 
 # Уровни подразделений
 DIVISION_LEVELS = ['сектор', 'отдел', 'управление', 'центр']
 
+# Диапазон дат поступления устройств по умолчанию
+RECEIPT_DATE_START = '2015-01-01'
+RECEIPT_DATE_END = '2025-06-01'
+
+@lru_cache(maxsize=None)
+def _date_ordinal(date_str: str) -> int:
+    """Порядковый номер дня для даты в формате 'YYYY-MM-DD' (разбирается один раз)"""
+    return date.fromisoformat(date_str).toordinal()
+
 # Генерация случайной даты
-def random_date(start_date: str, end_date: str) -> str:
+def random_date(start_date: str = RECEIPT_DATE_START, end_date: str = RECEIPT_DATE_END) -> str:
     """Генерирует случайную дату в заданном диапазоне."""
-    start = datetime.strptime(start_date, '%Y-%m-%d')
-    end = datetime.strptime(end_date, '%Y-%m-%d')
-    delta = end - start
-    random_days = random.randint(0, delta.days)
-    return (start + timedelta(days=random_days)).strftime('%Y-%m-%d')
+    day = _RNG.randint(_date_ordinal(start_date), _date_ordinal(end_date))
+    return date.fromordinal(day).isoformat()
 
 # Выбор случайного элемента с учетом весов
-def weighted_choice(choices: List[Tuple[str, int]]) -> str:
-    """Выбирает случайный элемент с учетом весов.
+def weighted_choice(values: Sequence[Any], cum_weights: Sequence[int]) -> Any:
+    """Выбирает случайный элемент с учетом весов (бинарным поиском по накопленным весам).
     
     Args:
-        choices: Список кортежей (значение, вес)
+        values: Значения
+        cum_weights: Накопленные веса значений (например, itertools.accumulate от весов)
         
     Returns:
         Выбранное значение
     """
-    total = sum(weight for _, weight in choices)
-    r = random.uniform(0, total)
-    upto = 0
-    for value, weight in choices:
-        if upto + weight >= r:
-            return value
-        upto += weight
-    return choices[0][0]  # fallback
+    return values[bisect(cum_weights, _RNG.random() * cum_weights[-1])]
 
-def get_env_value(key: str, env_content: str) -> Optional[str]:
-    """Получение значения переменной из файла .venv"""
-    try:
-        # Ищем строку, начинающуюся с ключа
-        pattern = fr'^{key}\s*=\s*([^\n#]+)'
-        match = re.search(pattern, env_content, re.MULTILINE)
-        if not match:
-            return None
-        
-        value = match.group(1).strip()
-        # Удаляем кавычки, если они есть
-        value = value.strip('\'"')
-        return value.strip()
-    except Exception as e:
-        print(f"Ошибка при получении значения {key}: {e}")
-        return None
-
-    def init_openai_client() -> None:
-        """Инициализация клиента OpenAI"""
-        global client
-        try:
-            # Чтение файла .venv
-            venv_path = os.path.join('venv', '.venv')
-            with open(venv_path, 'r', encoding='utf-8') as f:
-                venv_content = f.read()
-            
-            # Получаем AI_TUNNEL_KEY
-            ai_tunnel_key = get_env_value('AI_TUNNEL_KEY', venv_content)
-            if not ai_tunnel_key:
-                raise ValueError("Не найден AI_TUNNEL_KEY в файле venv/.venv")
-            
-            # Инициализация клиента OpenAI
-            client = OpenAI(
-                api_key=ai_tunnel_key,
-                base_url="https://api.aitunnel.ru/v1"
-            )
-            print("Клиент OpenAI успешно инициализирован")
-            
-        except Exception as e:
-            print(f"Ошибка при инициализации клиента OpenAI: {e}")
-            raise
+# Справочные данные, уже загруженные в текущем процессе
+_REF_CACHE: Optional[Dict[str, Any]] = None
 
 async def generate_reference_data() -> Dict[str, Any]:
     """Генерация справочных данных (города, подразделения, должности)"""
+    global _REF_CACHE
+    if _REF_CACHE is not None:
+        return _REF_CACHE
+    
     try:
         # Пытаемся загрузить из кэша, чтобы не генерировать заново
-        if os.path.exists('reference_cache.json'):
+        try:
             with open('reference_cache.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
+                _REF_CACHE = json.load(f)
+            return _REF_CACHE
+        except FileNotFoundError:
+            pass
         
         # Если кэша нет, используем встроенные тестовые данные
         data = {
@@ -1062,6 +993,7 @@ async def generate_reference_data() -> Dict[str, Any]:
         with open('reference_cache.json', 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
+        _REF_CACHE = data
         return data
         
     except Exception as e:
@@ -1076,80 +1008,118 @@ async def generate_reference_data() -> Dict[str, Any]:
             ]
         }
 
-async def generate_employee(emp_id: int, cities: List[str], positions: List[Dict]) -> Dict[str, Any]:
+# Справочники для генерации ФИО (кортежи создаются один раз при импорте)
+LAST_NAMES = ('Иванов', 'Петров', 'Сидоров', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Павлов')
+FIRST_NAMES_MALE = ('Александр', 'Дмитрий', 'Михаил', 'Андрей', 'Сергей', 'Алексей', 'Артём', 'Иван')
+FIRST_NAMES_FEMALE = ('Елена', 'Мария', 'Анна', 'Ольга', 'Наталья', 'Ирина', 'Татьяна', 'Екатерина')
+MIDDLE_NAMES_MALE = ('Александрович', 'Дмитриевич', 'Сергеевич', 'Андреевич', 'Алексеевич')
+MIDDLE_NAMES_FEMALE = ('Александровна', 'Дмитриевна', 'Сергеевна', 'Андреевна', 'Алексеевна')
+
+def generate_employee(emp_id: int, cities: List[str], positions: List[Dict]) -> Dict[str, Any]:
     """Генерация данных сотрудника"""
-    # Генерация ФИО
-    last_names = ['Иванов', 'Петров', 'Сидоров', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Павлов']
-    first_names_male = ['Александр', 'Дмитрий', 'Михаил', 'Андрей', 'Сергей', 'Алексей', 'Артём', 'Иван']
-    first_names_female = ['Елена', 'Мария', 'Анна', 'Ольга', 'Наталья', 'Ирина', 'Татьяна', 'Екатерина']
-    
     # Определяем пол по случайному выбору
-    gender = random.choice(['male', 'female'])
+    is_female = _RNG.random() < 0.5
     
-    if gender == 'male':
-        first_name = random.choice(first_names_male)
-        middle_name = random.choice(['Александрович', 'Дмитриевич', 'Сергеевич', 'Андреевич', 'Алексеевич'])
+    if is_female:
+        first_name = _RNG.choice(FIRST_NAMES_FEMALE)
+        middle_name = _RNG.choice(MIDDLE_NAMES_FEMALE)
     else:
-        first_name = random.choice(first_names_female)
-        middle_name = random.choice(['Александровна', 'Дмитриевна', 'Сергеевна', 'Андреевна', 'Алексеевна'])
+        first_name = _RNG.choice(FIRST_NAMES_MALE)
+        middle_name = _RNG.choice(MIDDLE_NAMES_MALE)
     
-    last_name = random.choice(last_names) + ('а' if gender == 'female' else '')
+    last_name = _RNG.choice(LAST_NAMES) + ('а' if is_female else '')
     fio = f"{last_name} {first_name} {middle_name}"
     
     # Выбираем случайную должность
-    position = random.choice(positions)
+    position = _RNG.choice(positions)
     is_manager = position.get('is_manager', False)
     
     # Выбираем город и генерируем полный адрес
-    city = random.choice(cities)
+    city = _RNG.choice(cities)
     address = generate_address(city)
     
     return {
-        'empID': f"emp_{emp_id:04d}",
+        'empID': _EMP_IDS[emp_id - 1] if 0 < emp_id <= NUM_EMPLOYEES else f"emp_{emp_id:04d}",
         'fio': fio,
-        'tn': f"{random.randint(10000000, 99999999)}",
+        'tn': f"{_RNG.randint(10000000, 99999999)}",
         'position': position['name'],
         'division': 'Не распределено',  # Временное значение, будет перезаписано
         'location': address,  # Полный адрес
         'is_manager': is_manager
     }
 
+def generate_employees(count: int, cities: List[str], positions: List[Dict]) -> List[Dict[str, Any]]:
+    """
+    Пакетная генерация сотрудников с ID от 1 до count
+    
+    Пол, ФИО, должности, табельные номера и адреса разыгрываются сразу
+    для всех сотрудников, после чего записи собираются за один проход.
+    
+    Args:
+        count: Количество сотрудников
+        cities: Список городов
+        positions: Список должностей
+        
+    Returns:
+        Список сотрудников в том же формате, что и generate_employee
+    """
+    is_female = _RNG.choices((False, True), k=count)
+    last_names = _RNG.choices(LAST_NAMES, k=count)
+    first_names_male = _RNG.choices(FIRST_NAMES_MALE, k=count)
+    first_names_female = _RNG.choices(FIRST_NAMES_FEMALE, k=count)
+    middle_names_male = _RNG.choices(MIDDLE_NAMES_MALE, k=count)
+    middle_names_female = _RNG.choices(MIDDLE_NAMES_FEMALE, k=count)
+    chosen_positions = _RNG.choices(positions, k=count)
+    tns = _RNG.sample(range(10000000, 100000000), count)  # табельные номера без повторов
+    addresses = generate_addresses(_RNG.choices(cities, k=count))
+    
+    emp_ids = _EMP_IDS if count <= NUM_EMPLOYEES else tuple(f"emp_{i:04d}" for i in range(1, count + 1))
+    
+    employees = []
+    for i in range(count):
+        if is_female[i]:
+            fio = f"{last_names[i]}а {first_names_female[i]} {middle_names_female[i]}"
+        else:
+            fio = f"{last_names[i]} {first_names_male[i]} {middle_names_male[i]}"
+        position = chosen_positions[i]
+        employees.append({
+            'empID': emp_ids[i],
+            'fio': fio,
+            'tn': str(tns[i]),
+            'position': position['name'],
+            'division': 'Не распределено',  # Временное значение, будет перезаписано
+            'location': addresses[i],  # Полный адрес
+            'is_manager': position.get('is_manager', False)
+        })
+    return employees
+
 def assign_divisions_to_employees(employees: List[Dict], divisions: List[Dict]) -> None:
     """Распределение сотрудников по подразделениям"""
-    # Собираем все доступные названия подразделений
-    division_names = [d.get('name', 'Основное подразделение') for d in divisions]
+    default_name = 'Основное подразделение'
+    # Собираем все доступные названия подразделений (пустые названия заменяем заглушкой)
+    division_names = [d.get('name') or default_name for d in divisions]
     if not division_names:  # Если подразделений нет, используем заглушку
-        division_names = ['Основное подразделение']
+        division_names = [default_name]
     
     # Сортируем подразделения по уровню (от высшего к низшему)
-    sorted_divisions = sorted([d for d in divisions if d.get('parent') is not None], 
-                             key=lambda x: x.get('level', 0), reverse=True)
-    
-    # Распределяем руководителей по подразделениям
-    managers = [e for e in employees if e.get('is_manager', False)]
-    non_managers = [e for e in employees if not e.get('is_manager', False)]
-    
-    # Распределяем руководителей по управлениям и отделам
-    for i, manager in enumerate(managers):
-        if i < len(sorted_divisions):
-            manager['division'] = sorted_divisions[i].get('name', 'Основное подразделение')
-        else:
-            manager['division'] = random.choice(division_names)
+    sorted_names = [d.get('name') or default_name
+                    for d in sorted((d for d in divisions if d.get('parent') is not None),
+                                    key=lambda x: x.get('level', 0), reverse=True)]
     
-    # Распределяем обычных сотрудников по подразделениям
-    for emp in non_managers:
-        emp['division'] = random.choice(division_names)
+    # Разделяем сотрудников на руководителей и остальных за один проход
+    managers, non_managers = [], []
+    for e in employees:
+        (managers if e.get('is_manager', False) else non_managers).append(e)
     
-    # Дополнительная проверка на случай, если кто-то остался без подразделения
-    for emp in employees:
-        if not emp.get('division'):
-            emp['division'] = random.choice(division_names)
+    # Руководителей сначала распределяем по управлениям и отделам,
+    # оставшимся (и обычным сотрудникам) подразделение выбирается случайно
+    spare_managers = managers[len(sorted_names):]
+    random_names = _RNG.choices(division_names, k=len(spare_managers) + len(non_managers))
     
-    # Распределяем остальных сотрудников
-    for emp in non_managers:
-        # Выбираем случайное подразделение
-        div = random.choice(divisions)
-        emp['division'] = div.get('name', 'Основное подразделение')
+    for manager, name in zip(managers, sorted_names):
+        manager['division'] = name
+    for emp, name in zip(spare_managers + non_managers, random_names):
+        emp['division'] = name
 
 def generate_divisions_hierarchy(divisions: List[Dict]) -> List[Dict]:
     """Генерация иерархии подразделений"""
@@ -1170,10 +1140,34 @@ def generate_divisions_hierarchy(divisions: List[Dict]) -> List[Dict]:
         })
     return result
 
+def _json_bytes(obj: Any) -> bytes:
+    """Сериализация объекта в JSON (UTF-8) через orjson, если он установлен"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
 def save_to_json(data: Dict[str, Any], filename: str) -> None:
-    """Сохранение данных в JSON файл"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+    """
+    Сохранение данных в JSON файл
+    
+    Файл пишется потоково и без отступов: списки записей выводятся по одной
+    записи на строку, каждая запись сериализуется отдельно (orjson или json),
+    поэтому JSON всего документа не собирается в памяти целиком.
+    """
+    with open(filename, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(data.items()):
+            f.write(b',\n' if i else b'\n')
+            f.write(_json_bytes(key) + b': ')
+            if isinstance(value, list):
+                f.write(b'[')
+                for j, item in enumerate(value):
+                    f.write(b',\n' if j else b'\n')
+                    f.write(_json_bytes(item))
+                f.write(b'\n]')
+            else:
+                f.write(_json_bytes(value))
+        f.write(b'\n}\n')
     print(f"Данные сохранены в {filename}")
 
 async def generate_data():
@@ -1191,9 +1185,6 @@ async def generate_data():
         print("\n1. Генерация справочных данных...")
         try:
             ref_data = await generate_reference_data()
-            print(f"   • Города: {len(ref_data['cities'])}")
-            print(f"   • Подразделения: {len(ref_data['divisions'])}")
-            print(f"   • Должности: {len(ref_data['positions'])}")
         except Exception as e:
             print(f"Ошибка при генерации справочных данных: {str(e)}")
             ref_data = {
@@ -1205,20 +1196,14 @@ async def generate_data():
                 ]
             }
             print(f"   • Используются стандартные значения")
-            print(f"   • Города: {len(ref_data['cities'])}")
-            print(f"   • Подразделения: {len(ref_data['divisions'])}")
-            print(f"   • Должности: {len(ref_data['positions'])}")
+        print(f"   • Города: {len(ref_data['cities'])}")
+        print(f"   • Подразделения: {len(ref_data['divisions'])}")
+        print(f"   • Должности: {len(ref_data['positions'])}")
         
         # 2. Генерация сотрудников
         print("\n2. Генерация сотрудников...")
-        employees = []
-        for i in range(1, NUM_EMPLOYEES + 1):
-            if i % 100 == 0 or i == 1 or i == NUM_EMPLOYEES:
-                print(f"   • Сотрудник {i}/{NUM_EMPLOYEES}")
-            
-            emp = await generate_employee(i, ref_data['cities'], ref_data['positions'])
-            if emp:
-                employees.append(emp)
+        employees = generate_employees(NUM_EMPLOYEES, ref_data['cities'], ref_data['positions'])
+        print(f"   • Сгенерировано {len(employees)} сотрудников")
         
         # 3. Распределение по подразделениям
         print("\n3. Распределение по подразделениям...")
@@ -1229,130 +1214,67 @@ async def generate_data():
         
         # 4. Генерация устройств
         print("\n4. Генерация устройств...")
-        devices = []
-        data_gen = DataGenerator()
+        # Сначала собираем состав устройств (сотрудник, тип, модель),
+        # затем генерируем все устройства одним пакетом
+        specs: List[Tuple[str, DeviceType, str]] = []
+        manager_employees = []
         
         # Сначала генерируем обязательные устройства для всех сотрудников
+        # (в том же проходе собираем руководителей для дополнительных устройств)
         for emp in employees:
             is_manager = emp.get('is_manager', False)
+            if is_manager:
+                manager_employees.append(emp)
             
             # Обязательные устройства для всех
-            for dev_type, settings in DEVICE_DEFAULTS.items():
-                if settings.get('manager_only', False) and not is_manager:
-                    continue
-                    
-                min_count = settings['min']
-                max_count = settings['max']
-                
-                # Генерируем указанное количество устройств
-                count = random.randint(min_count, max_count)
-                for _ in range(count):
-                    if len(devices) >= NUM_DEVICES:
+            pool = _DEVICE_TYPES_MANAGER if is_manager else _DEVICE_TYPES_REGULAR
+            for dev_type, min_count, max_count in pool:
+                # Добавляем указанное количество устройств
+                quantity = _RNG.randint(min_count, max_count)
+                for _ in range(quantity):
+                    if len(specs) >= NUM_DEVICES:
                         break
                         
                     # Выбираем модель для данного типа устройства
-                    model = random.choice(DEVICE_MODELS[dev_type])
-                    
-                    # Создаем устройство с указанным типом и моделью
-                    device = await data_gen.generate_device(
-                        device_id=len(devices) + 1,
-                        emp_id=emp['empID'],
-                        is_manager=is_manager,
-                        device_type=dev_type,
-                        model=model
-                    )
-                    
-                    if device:
-                        devices.append(device.to_dict() if hasattr(device, 'to_dict') else device)
+                    model = _RNG.choice(DEVICE_MODELS[dev_type])
+                    specs.append((emp['empID'], dev_type, model))
         
-        # Затем генерируем дополнительные устройства для руководителей
-        manager_employees = [emp for emp in employees if emp.get('is_manager', False)]
-        if manager_employees and len(devices) < NUM_DEVICES:
-            # Дополнительные устройства для руководителей
-            extra_devices = [
-                (DeviceType.LAPTOP, 0.7),  # 70% шанс на ноутбук
-                (DeviceType.TABLET, 0.4),   # 40% шанс на планшет
-                (DeviceType.MONITOR, 0.3)   # 30% шанс на дополнительный монитор
-            ]
-            
+        # Затем добавляем дополнительные устройства для руководителей
+        if manager_employees and len(specs) < NUM_DEVICES:
             for emp in manager_employees:
-                if len(devices) >= NUM_DEVICES:
+                if len(specs) >= NUM_DEVICES:
                     break
                     
-                for device_type, probability in extra_devices:
-                    if random.random() < probability:
+                for device_type, probability in MANAGER_EXTRA_DEVICES:
+                    if _RNG.random() < probability:
                         # Выбираем модель для данного типа устройства
-                        model = random.choice(DEVICE_MODELS[device_type])
-                        
-                        # Создаем устройство с указанным типом и моделью
-                        device = await data_gen.generate_device(
-                            device_id=len(devices) + 1,
-                            emp_id=emp['empID'],
-                            is_manager=True,
-                            device_type=device_type,
-                            model=model
-                        )
-                        
-                        if device:
-                            devices.append(device.to_dict() if hasattr(device, 'to_dict') else device)
+                        model = _RNG.choice(DEVICE_MODELS[device_type])
+                        specs.append((emp['empID'], device_type, model))
                             
-                        if len(devices) >= NUM_DEVICES:
+                        if len(specs) >= NUM_DEVICES:
                             break
         
         # Если остались доступные устройства, распределяем их случайным образом
-        remaining_devices = NUM_DEVICES - len(devices)
+        remaining_devices = NUM_DEVICES - len(specs)
         if remaining_devices > 0:
             print(f"   • Распределение оставшихся {remaining_devices} устройств...")
             
-            # Создаем список всех возможных типов устройств с их весами
-            device_weights = [
-                (DeviceType.DESKTOP, 20),
-                (DeviceType.LAPTOP, 15),
-                (DeviceType.MONITOR, 25),
-                (DeviceType.PHONE, 15),
-                (DeviceType.TABLET, 10),
-                (DeviceType.KEYBOARD, 10),
-                (DeviceType.MOUSE, 5)
-            ]
-            
-            for _ in range(remaining_devices):
-                if len(devices) >= NUM_DEVICES:
-                    break
-                    
-                # Выбираем случайный тип устройства с учетом весов
-                total_weight = sum(weight for _, weight in device_weights)
-                r = random.uniform(0, total_weight)
-                upto = 0
-                for device_type, weight in device_weights:
-                    if upto + weight >= r:
-                        break
-                    upto += weight
-                
-                # Выбираем случайного сотрудника
-                emp = random.choice(employees)
-                
+            # Типы устройств (с учетом весов) и сотрудников выбираем сразу для всех оставшихся устройств
+            device_types = _RNG.choices(_DEVICE_TYPE_VALUES, cum_weights=_DEVICE_TYPE_CUM, k=remaining_devices)
+            owners = _RNG.choices(employees, k=remaining_devices)
+            for device_type, emp in zip(device_types, owners):
                 # Выбираем модель для данного типа устройства
-                model = random.choice(DEVICE_MODELS[device_type])
-                
-                # Создаем устройство
-                device = await data_gen.generate_device(
-                    device_id=len(devices) + 1,
-                    emp_id=emp['empID'],
-                    is_manager=emp.get('is_manager', False),
-                    device_type=device_type,
-                    model=model
-                )
-                
-                if device:
-                    devices.append(device.to_dict() if hasattr(device, 'to_dict') else device)
+                model = _RNG.choice(DEVICE_MODELS[device_type])
+                specs.append((emp['empID'], device_type, model))
         
+        devices = generate_devices(specs)
         print(f"   • Всего сгенерировано {len(devices)} устройств")
         
         # 5. Формируем итоговые данные
         print("\n5. Формирование результата...")
         result = {
             'employees': employees,
-            'devices': devices,
+            'devices': [device.to_dict() for device in devices],
             'reference_data': ref_data
         }
         
@@ -1366,8 +1288,7 @@ async def generate_data():
             os.remove(output_file)
             print(f"Удален старый файл: {output_file}")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        save_to_json(result, output_file)
         return result
         
     except Exception as e:
@@ -1377,17 +1298,7 @@ async def generate_data():
         return None
 
 async def main():
-    """Основная функция для запуска генерации данных"""
-    print("=== Генератор тестовых данных для банка ===")
-    print(f"Будет сгенерировано:")
-    print(f"- Сотрудники: {NUM_EMPLOYEES}")
-    print(f"- Устройства: {NUM_DEVICES}")
-    print("\nНачало генерации...")
-
-    # Создаем директорию для выходных данных, если её нет
-    os.makedirs('output', exist_ok=True)
-
-    # Запускаем асинхронную генерацию данных
+    """Основная функция для запуска генерации данных (заголовок печатает generate_data)"""
     try:
         return await generate_data()
     except Exception as e:
@@ -1396,8 +1307,6 @@ async def main():
         traceback.print_exc()
         return False
 
-# Удаляем дублирующееся определение DEVICE_STATUSES
-
 # Списки для генерации адресов
 STREET_TYPES = ['ул.', 'пр-т', 'шоссе', 'наб.', 'пер.', 'б-р']
 STREET_NAMES = [
@@ -1447,24 +1356,67 @@ CITY_ADDRESSES = {
         'districts': ['Ворошиловский', 'Советский', 'Кировский']
     }
 }
+# Списки улиц и районов храним кортежами
+STREET_TYPES = tuple(STREET_TYPES)
+STREET_NAMES = tuple(STREET_NAMES)
+CITY_ADDRESSES = {
+    city: {'streets': tuple(data['streets']), 'districts': tuple(data['districts'])}
+    for city, data in CITY_ADDRESSES.items()
+}
+
+# Варианты корпуса/строения: без суффикса, корпус 1-5, строение 1-10 -
+# каждая из трех групп выпадает с вероятностью 1/3
+_BUILDING_SUFFIXES = (
+    ('',)
+    + tuple(f', к{n}' for n in range(1, 6))
+    + tuple(f', стр. {n}' for n in range(1, 11))
+)
+_BUILDING_CUM_WEIGHTS = tuple(accumulate((10,) + (2,) * 5 + (1,) * 10))
+
+def generate_addresses(cities: List[str]) -> List[str]:
+    """
+    Пакетная генерация адресов: по одному адресу на каждый город из списка.
+    
+    Номера домов и корпусов/строений разыгрываются сразу для всего списка,
+    а улицы и районы - одним вызовом на каждый город, чтобы не обращаться
+    к генератору случайных чисел отдельно для каждого адреса.
+    
+    Args:
+        cities: Список городов (может содержать повторы)
+        
+    Returns:
+        Список адресов той же длины, что и cities
+    """
+    count = len(cities)
+    houses = _RNG.choices(range(1, 201), k=count)
+    buildings = _RNG.choices(_BUILDING_SUFFIXES, cum_weights=_BUILDING_CUM_WEIGHTS, k=count)
+    
+    # Группируем позиции адресов по городам
+    positions_by_city: Dict[str, List[int]] = defaultdict(list)
+    for i, city in enumerate(cities):
+        positions_by_city[city].append(i)
+    
+    # Часть адреса до номера дома: город, район (если известен) и улица
+    streets: List[str] = [''] * count
+    for city, positions in positions_by_city.items():
+        size = len(positions)
+        city_data = CITY_ADDRESSES.get(city)
+        if city_data is None:
+            # Если города нет в списке, используем общий формат
+            parts = [f"{city}, {street_type} {street_name}" for street_type, street_name in zip(
+                _RNG.choices(STREET_TYPES, k=size), _RNG.choices(STREET_NAMES, k=size))]
+        else:
+            # Используем специфичные для города данные
+            parts = [f"{city}, {district} р-н, {street}" for district, street in zip(
+                _RNG.choices(city_data['districts'], k=size), _RNG.choices(city_data['streets'], k=size))]
+        for i, part in zip(positions, parts):
+            streets[i] = part
+    
+    return [f"{street}, д. {house}{building}" for street, house, building in zip(streets, houses, buildings)]
 
 def generate_address(city: str) -> str:
     """Генерирует случайный адрес в указанном городе"""
-    if city not in CITY_ADDRESSES:
-        # Если города нет в списке, используем общий формат
-        street_type = random.choice(STREET_TYPES)
-        street_name = random.choice(STREET_NAMES)
-        house = random.randint(1, 200)
-        building = random.choice(['', f', к{random.randint(1, 5)}', f', стр. {random.randint(1, 10)}'])
-        return f"{city}, {street_type} {street_name}, д. {house}{building}"
-    
-    # Используем специфичные для города данные
-    city_data = CITY_ADDRESSES[city]
-    street = random.choice(city_data['streets'])
-    district = random.choice(city_data['districts'])
-    house = random.randint(1, 200)
-    building = random.choice(['', f', к{random.randint(1, 5)}', f', стр. {random.randint(1, 10)}'])
-    return f"{city}, {district} р-н, {street}, д. {house}{building}"
+    return generate_addresses([city])[0]
 
 async def shutdown(signal, loop):
     """Аккуратная обработка завершения работы"""
@@ -1478,10 +1430,7 @@ async def shutdown(signal, loop):
     loop.stop()
 
 if __name__ == "__main__":
-    import asyncio
     import signal
-    import time
-    from datetime import datetime
     
     # Создаем и настраиваем цикл событий
     loop = asyncio.new_event_loop()
@@ -1514,8 +1463,7 @@ if __name__ == "__main__":
                 }
                 
                 os.makedirs('data', exist_ok=True)
-                with open('data/generation_stats.json', 'w', encoding='utf-8') as f:
-                    json.dump(stats, f, ensure_ascii=False, indent=2)
+                save_to_json(stats, os.path.join('data', 'generation_stats.json'))
                 
                 return True
             else:
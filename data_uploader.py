@@ -1,67 +1,201 @@
 import os
+import re
+import ast
 import json
 import asyncio
+import hashlib
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import count
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Iterator, Iterable, Tuple
 
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Необязательная зависимость: быстрый разбор JSON
+except ImportError:
+    orjson = None
+
 # Настройка логирования
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('uploader.log')
+        logging.FileHandler('uploader.log', delay=True)  # Файл открывается при первой записи
     ]
 )
 logger = logging.getLogger(__name__)
 
 # Константы
-BATCH_SIZE = 400  # Максимальное количество операций в одной пакетной записи
+PAGE_SIZE = 400  # Количество документов, читаемых за один запрос при удалении коллекции
+MAX_WRITE_ATTEMPTS = 5  # Максимальное количество попыток записи одного документа
+PROGRESS_LOG_EVERY = 1000  # Периодичность сообщений о прогрессе записи
+# Ограничение скорости BulkWriter (операций в секунду): начальная скорость по правилу 500/50/5
+# и потолок, до которого она наращивается. Потолок можно поднять, если позволяет квота проекта.
+BULK_INITIAL_OPS_PER_SECOND = 500
+BULK_MAX_OPS_PER_SECOND = 2000
+# Добавлять к ID документов сотрудников и устройств короткий хэш-префикс (например, '3fa2_emp_0001'),
+# чтобы последовательные ID не попадали в один диапазон индекса. Поля empID/ID в документах не меняются.
+SHARD_DOC_IDS = False
+CREDENTIALS_PATH = os.path.join('venv', '.venv')  # Файл с учетными данными сервисного аккаунта
+
+# Словарь FIREBASE_SERVICE_ACCOUNT в синтаксисе Python внутри файла с учетными данными
+_SA_RE = re.compile(r'FIREBASE_SERVICE_ACCOUNT\s*=\s*({.*?})\s*$', re.DOTALL | re.MULTILINE)
+
+@lru_cache(maxsize=1)
+def _load_service_account(path: str = CREDENTIALS_PATH) -> Dict[str, Any]:
+    """
+    Загрузка учетных данных сервисного аккаунта (результат кэшируется)
+    
+    Файл может содержать либо JSON целиком, либо строку вида FIREBASE_SERVICE_ACCOUNT = {...}
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Файл с учетными данными не найден: {path}")
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Быстрый путь: файл целиком в формате JSON
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+    
+    # Ищем словарь FIREBASE_SERVICE_ACCOUNT в файле
+    key_pos = content.find('FIREBASE_SERVICE_ACCOUNT')
+    start = content.find('{', key_pos) if key_pos != -1 else -1
+    if start == -1:
+        raise ValueError("Не удалось найти FIREBASE_SERVICE_ACCOUNT в файле .venv")
+    
+    # Словарь в формате JSON разбираем за один линейный проход, без поиска границ регулярным выражением
+    try:
+        cred_dict, _ = json.JSONDecoder().raw_decode(content, start)
+        return cred_dict
+    except json.JSONDecodeError:
+        pass
+    
+    # Словарь в синтаксисе Python (одинарные кавычки, True/False)
+    match = _SA_RE.search(content)
+    
+    if not match:
+        raise ValueError("Не удалось найти FIREBASE_SERVICE_ACCOUNT в файле .venv")
+    
+    # Преобразуем строку со словарем в словарь
+    try:
+        # Используем ast.literal_eval для безопасного преобразования строки в словарь
+        return ast.literal_eval(match.group(1).strip())
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"Ошибка при разборе FIREBASE_SERVICE_ACCOUNT: {e}")
+
+# Документы коллекции referenceData (имя документа совпадает с ключом в reference_data)
+REFERENCE_DATA_KEYS = ('cities', 'divisions', 'positions')
+
+# Поля записей, которые сохраняются строками, и поля, которые сохраняются как есть
+EMPLOYEE_STR_FIELDS = ('empID', 'fio', 'tn', 'position', 'division', 'location')
+EMPLOYEE_PASSTHROUGH_FIELDS = ('is_manager',)
+DEVICE_STR_FIELDS = ('ID', 'empID', 'nomenclature', 'model', 'dateReceipt',
+                     'usefulLife', 'status', 'ctc', 'serialNumber', 'fullNomenclature')
+DEVICE_PASSTHROUGH_FIELDS = ()
+
+# Выборка строковых полей записи одним вызовом
+_EMPLOYEE_STR_VALUES = itemgetter(*EMPLOYEE_STR_FIELDS)
+_DEVICE_STR_VALUES = itemgetter(*DEVICE_STR_FIELDS)
+
+def _coerce_value(value: Any) -> Any:
+    """Преобразование значения в строку (кроме словарей, списков и bool)"""
+    return value if isinstance(value, (dict, list, bool)) else str(value)
+
+def _coerce_record(record: Dict[str, Any], str_fields: tuple, str_values: itemgetter,
+                   passthrough_fields: tuple) -> Dict[str, Any]:
+    """
+    Подготовка записи к сохранению в Firestore
+    
+    Известные поля обрабатываются по заранее заданным спискам без проверки типов;
+    неизвестные поля преобразуются через _coerce_value.
+    """
+    try:
+        result = dict(zip(str_fields, map(str, str_values(record))))
+    except KeyError:
+        # В записи есть не все поля, выбираем имеющиеся по одному
+        result = {k: str(record[k]) for k in str_fields if k in record}
+    for k in passthrough_fields:
+        if k in record:
+            result[k] = record[k]
+    if len(result) != len(record):
+        for k, v in record.items():
+            if k not in result:
+                result[k] = _coerce_value(v)
+    return result
+
+def _document_id(record_id: str) -> str:
+    """ID документа Firestore для записи (с детерминированным хэш-префиксом при SHARD_DOC_IDS)"""
+    if not SHARD_DOC_IDS:
+        return record_id
+    prefix = hashlib.blake2b(record_id.encode('utf-8'), digest_size=2).hexdigest()
+    return f"{prefix}_{record_id}"
+
+def _unique_by_id(records: Iterable[Dict[str, Any]], id_field: str, label: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Перебор записей с непустым ID без повторов
+    
+    Для повторяющегося ID остается последняя запись (как при последовательной перезаписи
+    документа), а лишние записи в Firestore не выполняются. Порядок записей определяется
+    первым появлением ID.
+    """
+    records_by_id: Dict[str, Dict[str, Any]] = {}
+    total = 0
+    for record in records:
+        record_id = str(record.get(id_field, ''))
+        if record_id:
+            records_by_id[record_id] = record
+            total += 1
+    duplicates = total - len(records_by_id)
+    if duplicates:
+        logger.warning("Пропущено %d %s с повторяющимся ID (сохранены последние записи)", duplicates, label)
+    return iter(records_by_id.items())
+
+def load_data(path: str) -> Dict[str, Any]:
+    """
+    Загрузка сгенерированных данных из JSON-файла
+    
+    Файл разбирается целиком до начала загрузки, поэтому поврежденный файл
+    обнаруживается раньше, чем будут удалены существующие коллекции.
+    Используется orjson (если установлен) или json.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+async def _run_in_thread(func, *args) -> Any:
+    """Выполнение блокирующего вызова в пуле потоков, не блокируя цикл событий (asyncio.to_thread требует Python 3.9)"""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
 
 class FirebaseUploader:
     def __init__(self):
         self.db = self.initialize_firebase()
-        self.batch = self.db.batch()
-        self.operation_count = 0
+        # BulkWriter сам разбивает записи на пакеты, выполняет их параллельно и повторяет неудачные
+        self.bulk_writer, self._failed_writes = self._create_bulk_writer()
         self.total_operations = 0
+        self._collections: Dict[str, Any] = {}  # Кэш ссылок на коллекции
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def initialize_firebase():
-        """Инициализация Firebase Admin SDK из файла .venv"""
+        """Инициализация Firebase Admin SDK из файла .venv (клиент создается один раз на процесс)"""
         try:
-            if not firebase_admin._apps:
-                # Путь к файлу с учетными данными
-                venv_path = os.path.join('venv', '.venv')
-                
-                if not os.path.exists(venv_path):
-                    raise FileNotFoundError(f"Файл с учетными данными не найден: {venv_path}")
-                
-                # Чтение содержимого файла
-                with open(venv_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Извлечение JSON из содержимого файла
-                import re
-                import ast
-                
-                # Ищем словарь FIREBASE_SERVICE_ACCOUNT в файле
-                match = re.search(r'FIREBASE_SERVICE_ACCOUNT\s*=\s*({.*?})\s*$', 
-                                content, re.DOTALL | re.MULTILINE)
-                
-                if not match:
-                    raise ValueError("Не удалось найти FIREBASE_SERVICE_ACCOUNT в файле .venv")
-                
-                # Преобразуем строку с JSON в словарь
-                try:
-                    # Используем ast.literal_eval для безопасного преобразования строки в словарь
-                    cred_dict = ast.literal_eval(match.group(1).strip())
-                except (ValueError, SyntaxError) as e:
-                    raise ValueError(f"Ошибка при разборе FIREBASE_SERVICE_ACCOUNT: {e}")
+            # Проверяем наличие приложения через публичный API, а не приватный firebase_admin._apps
+            try:
+                firebase_admin.get_app()
+            except ValueError:
+                cred_dict = _load_service_account()
                 
                 # Инициализация Firebase с учетными данными из словаря
                 cred = credentials.Certificate(cred_dict)
@@ -71,7 +205,7 @@ class FirebaseUploader:
             return firestore.client()
             
         except Exception as e:
-            logger.error(f"Ошибка при инициализации Firebase: {e}", exc_info=True)
+            logger.error("Ошибка при инициализации Firebase: %s", e, exc_info=True)
             raise
 
     async def delete_collection(self, collection_name: str) -> int:
@@ -85,83 +219,114 @@ class FirebaseUploader:
             int: Количество удаленных документов
         """
         try:
-            logger.info(f"Начало удаления коллекции: {collection_name}")
-            collection_ref = self.db.collection(collection_name)
+            logger.info("Начало удаления коллекции: %s", collection_name)
+            # Курсорная пагинация по ID документа: каждая страница читается ровно один раз
+            query = self.db.collection(collection_name).order_by(firestore.FieldPath.document_id())
             
-            # Получаем первую порцию документов
-            docs = collection_ref.limit(BATCH_SIZE).stream()
+            # Начинаем с первой порции документов
+            page = query.limit(PAGE_SIZE)
             
-            deleted = 0
             total_deleted = 0
-            batch = self.db.batch()
+            bulk_writer, failed_deletes = self._create_bulk_writer()
             
-            # Удаляем документы пакетами
-            while True:
-                doc_count = 0
-                
-                # Собираем пакет документов для удаления
-                for doc in docs:
-                    batch.delete(doc.reference)
-                    deleted += 1
-                    doc_count += 1
+            # Удаляем документы постранично; запись удалений идет в фоне, пока читается следующая страница
+            try:
+                while True:
+                    doc_count, last_doc = await _run_in_thread(self._delete_page, page, bulk_writer)
+                    total_deleted += doc_count
                     
-                    # Если набрали пакет, фиксируем
-                    if deleted % BATCH_SIZE == 0:
-                        batch.commit()
-                        logger.info(f"Удалено {deleted} документов из {collection_name}")
-                        batch = self.db.batch()
+                    # Если страница неполная, документов больше нет
+                    if doc_count < PAGE_SIZE:
                         break
-                
-                total_deleted += doc_count
-                
-                # Если документов больше нет, выходим
-                if doc_count < BATCH_SIZE:
-                    break
-                    
-                # Получаем следующую порцию документов
-                last_doc = None
-                for doc in collection_ref.limit(BATCH_SIZE).stream():
-                    last_doc = doc
-                    break
-                    
-                if last_doc is None:
-                    break
                     
-                docs = collection_ref.start_after(last_doc).limit(BATCH_SIZE).stream()
+                    # Следующая страница начинается после последнего документа текущей
+                    page = query.start_after(last_doc).limit(PAGE_SIZE)
+            finally:
+                await _run_in_thread(bulk_writer.close)
             
-            # Фиксируем оставшиеся изменения
-            if deleted % BATCH_SIZE != 0:
-                batch.commit()
-            
-            logger.info(f"Успешно удалено {total_deleted} документов из {collection_name}")
+            self._check_failed_writes(failed_deletes)
+            logger.info("Успешно удалено %d документов из %s", total_deleted, collection_name)
             return total_deleted
             
         except Exception as e:
-            logger.error(f"Критическая ошибка при удалении коллекции {collection_name}: {e}", exc_info=True)
+            logger.error("Критическая ошибка при удалении коллекции %s: %s", collection_name, e, exc_info=True)
             raise
 
+    @staticmethod
+    def _delete_page(query, bulk_writer) -> Tuple[int, Any]:
+        """
+        Постановка в очередь удаления документов страницы по мере их получения из потока
+        
+        Выполняется в отдельном потоке, чтобы не блокировать цикл событий.
+        
+        Returns:
+            Tuple[int, Any]: Количество документов на странице и последний документ
+        """
+        doc_count, last_doc = 0, None
+        for doc in query.stream():
+            bulk_writer.delete(doc.reference)
+            last_doc = doc
+            doc_count += 1
+        return doc_count, last_doc
+
+    def _create_bulk_writer(self) -> Tuple[Any, List[str]]:
+        """
+        Создание BulkWriter с логированием прогресса и ошибок записи
+        
+        Returns:
+            Tuple[Any, List[str]]: BulkWriter и список путей документов, запись которых
+            не удалась после всех попыток (заполняется по мере работы BulkWriter)
+        """
+        bulk_writer = self.db.bulk_writer(options=BulkWriterOptions(
+            initial_ops_per_second=BULK_INITIAL_OPS_PER_SECOND,
+            max_ops_per_second=BULK_MAX_OPS_PER_SECOND
+        ))
+        failed: List[str] = []
+        
+        def on_write_error(error, writer) -> bool:
+            retry = self._on_write_error(error, writer)
+            if not retry:
+                failed.append(error.operation.reference.path)
+            return retry
+        
+        bulk_writer.on_write_error(on_write_error)
+        
+        # Обратные вызовы выполняются в потоках BulkWriter; next() у itertools.count атомарен
+        written = count(1)
+        
+        def on_write_result(reference, result, writer) -> None:
+            done = next(written)
+            if done % PROGRESS_LOG_EVERY == 0:
+                logger.info("Обработано %d операций записи", done)
+        
+        bulk_writer.on_write_result(on_write_result)
+        return bulk_writer, failed
+
+    @staticmethod
+    def _check_failed_writes(failed: List[str]) -> None:
+        """Ошибка, если BulkWriter отказался от каких-либо операций после всех попыток"""
+        if failed:
+            raise RuntimeError(f"Не удалось выполнить {len(failed)} операций записи, например: {failed[0]}")
+
+    @staticmethod
+    def _on_write_error(error, bulk_writer) -> bool:
+        """Обработка неудачной записи: повторяем, пока не исчерпан лимит попыток"""
+        logger.error("Ошибка записи документа %s (попытка %d): %s",
+                     error.operation.reference.path, error.attempts, error.message)
+        return error.attempts < MAX_WRITE_ATTEMPTS
+
     def add_to_batch(self, collection: str, doc_id: str, data: Dict[str, Any]) -> None:
-        """Добавление операции в пакет"""
-        doc_ref = self.db.collection(collection).document(doc_id)
-        self.batch.set(doc_ref, data)
-        self.operation_count += 1
+        """Добавление операции записи в BulkWriter"""
+        collection_ref = self._collections.get(collection)
+        if collection_ref is None:
+            collection_ref = self._collections[collection] = self.db.collection(collection)
+        doc_ref = collection_ref.document(doc_id)
+        self.bulk_writer.set(doc_ref, data)
         self.total_operations += 1
-        
-        # Если накопилось достаточно операций, выполняем пакет
-        if self.operation_count >= BATCH_SIZE:
-            self.commit_batch()
 
-    def commit_batch(self) -> None:
-        """Выполнение пакетной операции"""
-        if self.operation_count > 0:
-            try:
-                self.batch.commit()
-                logger.info(f"Выполнена пакетная запись {self.operation_count} операций")
-                self.batch = self.db.batch()
-                self.operation_count = 0
-            except Exception as e:
-                logger.error(f"Ошибка при выполнении пакетной записи: {e}", exc_info=True)
-                raise
+    async def flush(self) -> None:
+        """Ожидание завершения всех поставленных в очередь операций записи"""
+        await _run_in_thread(self.bulk_writer.flush)
 
     async def upload_data(self, data: Dict[str, Any]) -> None:
         """Основная функция загрузки данных"""
@@ -171,69 +336,83 @@ class FirebaseUploader:
         try:
             # Удаление существующих коллекций
             collections_to_delete = ['employees', 'devices', 'referenceData']
-            logger.info(f"Начало удаления коллекций: {', '.join(collections_to_delete)}")
+            logger.info("Начало удаления коллекций: %s", ', '.join(collections_to_delete))
             
-            for collection in collections_to_delete:
-                try:
-                    deleted_count = await self.delete_collection(collection)
-                    logger.info(f"Удалено {deleted_count} документов из коллекции {collection}")
-                except Exception as e:
-                    logger.error(f"Не удалось удалить коллекцию {collection}: {e}")
-                    raise
+            # Коллекции независимы, поэтому удаляем их одновременно
+            results = await asyncio.gather(
+                *(self.delete_collection(collection) for collection in collections_to_delete),
+                return_exceptions=True
+            )
+            errors = []
+            for collection, result in zip(collections_to_delete, results):
+                if isinstance(result, Exception):
+                    logger.error("Не удалось удалить коллекцию %s: %s", collection, result)
+                    errors.append(result)
+                else:
+                    logger.info("Удалено %d документов из коллекции %s", result, collection)
+            if errors:
+                raise errors[0]
             
             # Загрузка эталонных данных
             if 'reference_data' in data:
                 ref_data = data['reference_data']
                 logger.info("Загрузка эталонных данных...")
                 
-                # Сохраняем города
-                self.add_to_batch('referenceData', 'cities', {'cities': ref_data.get('cities', [])})
-                
-                # Сохраняем подразделения
-                self.add_to_batch('referenceData', 'divisions', {'divisions': ref_data.get('divisions', [])})
+                # Города, подразделения и должности сохраняем одной атомарной пакетной записью
+                ref_batch = self.db.batch()
+                ref_collection = self.db.collection('referenceData')
+                for key in REFERENCE_DATA_KEYS:
+                    ref_batch.set(ref_collection.document(key), {key: ref_data.get(key, [])})
+                await _run_in_thread(ref_batch.commit)
+                self.total_operations += len(REFERENCE_DATA_KEYS)
                 
-                # Сохраняем должности
-                self.add_to_batch('referenceData', 'positions', {'positions': ref_data.get('positions', [])})
-                
-                logger.info(f"Загружено {len(ref_data.get('cities', []))} городов, "
-                          f"{len(ref_data.get('divisions', []))} подразделений, "
-                          f"{len(ref_data.get('positions', []))} должностей")
+                logger.info("Загружено %d городов, %d подразделений, %d должностей",
+                            len(ref_data.get('cities', [])),
+                            len(ref_data.get('divisions', [])),
+                            len(ref_data.get('positions', [])))
+            
+            # Сотрудники и устройства ставятся в очередь BulkWriter без ожидания между разделами:
+            # запись сотрудников идет в фоне, пока подготавливаются устройства
+            emp_count = device_count = 0
             
             # Загрузка сотрудников
-            if 'employees' in data and data['employees']:
-                logger.info(f"Загрузка {len(data['employees'])} сотрудников...")
-                for emp in data['employees']:
-                    emp_id = str(emp.get('empID', ''))
-                    if emp_id:
-                        # Преобразуем все поля в строки, чтобы избежать проблем с типами
-                        emp_data = {k: str(v) if not isinstance(v, (dict, list, bool)) else v 
-                                  for k, v in emp.items()}
-                        self.add_to_batch('employees', emp_id, emp_data)
+            if data.get('employees'):
+                logger.info("Загрузка сотрудников...")
+                for emp_id, emp in _unique_by_id(data['employees'], 'empID', 'сотрудников'):
+                    # Преобразуем поля в строки, чтобы избежать проблем с типами
+                    emp_data = _coerce_record(emp, EMPLOYEE_STR_FIELDS, _EMPLOYEE_STR_VALUES,
+                                              EMPLOYEE_PASSTHROUGH_FIELDS)
+                    self.add_to_batch('employees', _document_id(emp_id), emp_data)
+                    emp_count += 1
                 
-                self.commit_batch()  # Финализируем последний пакет
-                logger.info(f"Загружено {len(data['employees'])} сотрудников")
+                logger.info("Поставлено в очередь записи %d сотрудников", emp_count)
             
             # Загрузка устройств
-            if 'devices' in data and data['devices']:
-                logger.info(f"Загрузка {len(data['devices'])} устройств...")
-                for device in data['devices']:
-                    device_id = str(device.get('ID', ''))
-                    if device_id:
-                        device_data = {k: str(v) if not isinstance(v, (dict, list, bool)) else v 
-                                     for k, v in device.items()}
-                        self.add_to_batch('devices', device_id, device_data)
+            if data.get('devices'):
+                logger.info("Загрузка устройств...")
+                for device_id, device in _unique_by_id(data['devices'], 'ID', 'устройств'):
+                    device_data = _coerce_record(device, DEVICE_STR_FIELDS, _DEVICE_STR_VALUES,
+                                                 DEVICE_PASSTHROUGH_FIELDS)
+                    self.add_to_batch('devices', _document_id(device_id), device_data)
+                    device_count += 1
                 
-                self.commit_batch()  # Финализируем последний пакет
-                logger.info(f"Загружено {len(data['devices'])} устройств")
+                logger.info("Поставлено в очередь записи %d устройств", device_count)
+            
+            await self.flush()  # Дожидаемся записи всех документов
+            self._check_failed_writes(self._failed_writes)
+            logger.info("Загружено %d сотрудников и %d устройств", emp_count, device_count)
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
-            logger.info(f"Загрузка данных завершена за {duration:.2f} секунд")
-            logger.info(f"Всего выполнено {self.total_operations} операций записи")
+            logger.info("Загрузка данных завершена за %.2f секунд", duration)
+            logger.info("Всего выполнено %d операций записи", self.total_operations)
             
         except Exception as e:
-            logger.error(f"Критическая ошибка при загрузке данных: {e}", exc_info=True)
+            logger.error("Критическая ошибка при загрузке данных: %s", e, exc_info=True)
             raise
+        finally:
+            # Закрываем BulkWriter и при ошибке, чтобы остановить его пул потоков
+            await _run_in_thread(self.bulk_writer.close)
 
 async def main():
     """Основная асинхронная функция"""
@@ -241,12 +420,11 @@ async def main():
         # Загрузка данных из файла
         data_file = os.path.join('data', 'generated_data.json')
         if not os.path.exists(data_file):
-            logger.error(f"Файл с данными не найден: {data_file}")
+            logger.error("Файл с данными не найден: %s", data_file)
             return
         
-        logger.info(f"Чтение данных из файла: {data_file}")
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        logger.info("Чтение данных из файла: %s", data_file)
+        data = load_data(data_file)
         
         # Загрузка данных в Firebase
         uploader = FirebaseUploader()
@@ -255,9 +433,9 @@ async def main():
         logger.info("Все операции успешно завершены")
         
     except json.JSONDecodeError as e:
-        logger.error(f"Ошибка при разборе JSON: {e}")
+        logger.error("Ошибка при разборе JSON: %s", e)
     except Exception as e:
-        logger.error(f"Ошибка в главной функции: {e}", exc_info=True)
+        logger.error("Ошибка в главной функции: %s", e, exc_info=True)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file